@@ -0,0 +1,78 @@
+"""add counterparty, document type and product name dictionaries
+
+Revision ID: 5c1e8a3f9d20
+Revises:
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e8a3f9d20'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (таблица справочника, колонка значения, длина)
+DICTIONARIES = (
+    ("counterparties", "bin", 12),
+    ("document_types", "name", 100),
+    ("product_names", "name", 100),
+)
+
+# (таблица, старая строковая колонка, новая колонка-ссылка, справочник, колонка значения)
+REFERENCES = (
+    ("tasks", "document_type", "document_type_id", "document_types", "name"),
+    ("tasks", "counterparty_bin", "counterparty_id", "counterparties", "bin"),
+    ("tasks", "name", "name_id", "product_names", "name"),
+    ("shipment_products", "tovar_name", "tovar_name_id", "product_names", "name"),
+)
+
+
+def upgrade() -> None:
+    # init_db() мог уже создать справочники через create_all
+    for table, column, length in DICTIONARIES:
+        op.create_table(
+            table,
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(column, sa.String(length), nullable=False, unique=True),
+            if_not_exists=True,
+        )
+
+    for table, old_column, new_column, dictionary, value_column in REFERENCES:
+        op.add_column(table, sa.Column(new_column, sa.Integer(), nullable=True))
+        op.execute(
+            f"INSERT INTO {dictionary} ({value_column}) "
+            f"SELECT DISTINCT {old_column} FROM {table} "
+            f"ON CONFLICT ({value_column}) DO NOTHING"
+        )
+        op.execute(
+            f"UPDATE {table} SET {new_column} = {dictionary}.id "
+            f"FROM {dictionary} WHERE {dictionary}.{value_column} = {table}.{old_column}"
+        )
+        op.alter_column(table, new_column, nullable=False)
+        op.create_foreign_key(
+            f"fk_{table}_{new_column}", table, dictionary, [new_column], ["id"]
+        )
+        op.drop_column(table, old_column)
+
+
+def downgrade() -> None:
+    for table, old_column, new_column, dictionary, value_column in reversed(REFERENCES):
+        length = next(length for name, _, length in DICTIONARIES if name == dictionary)
+        op.add_column(table, sa.Column(old_column, sa.String(length), nullable=True))
+        op.execute(
+            f"UPDATE {table} SET {old_column} = {dictionary}.{value_column} "
+            f"FROM {dictionary} WHERE {dictionary}.id = {table}.{new_column}"
+        )
+        op.alter_column(table, old_column, nullable=False)
+        op.drop_constraint(f"fk_{table}_{new_column}", table, type_="foreignkey")
+        op.drop_column(table, new_column)
+
+    for table, _, _ in reversed(DICTIONARIES):
+        op.drop_table(table)
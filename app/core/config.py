@@ -19,4 +19,18 @@ class Config:
     "DATABASE_URL",
     f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
   )
-  
\ No newline at end of file
+
+  MAX_BODY_SIZE = int(os.getenv("MAX_BODY_SIZE", 10 * 1024 * 1024))
+  MAX_SHIPMENT_PRODUCTS = int(os.getenv("MAX_SHIPMENT_PRODUCTS", 10000))
+  SHIPMENT_BATCH_SIZE = int(os.getenv("SHIPMENT_BATCH_SIZE", 1000))
+  GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", 1024))
+  LOG_MAX_LENGTH = int(os.getenv("LOG_MAX_LENGTH", 500))
+  LOG_MAX_ITEMS = int(os.getenv("LOG_MAX_ITEMS", 10))
+
+  PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+  PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+  PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", 50))
+  SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 500))
+  SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE", "slow_queries.log")
+
+  DICTIONARY_CACHE_SIZE = int(os.getenv("DICTIONARY_CACHE_SIZE", 10000))
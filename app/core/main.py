@@ -4,13 +4,15 @@ from fastapi.security import APIKeyHeader
 from starlette.status import HTTP_401_UNAUTHORIZED
 from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.utils.logger import setup_logging
-from app.endpoints import invoices, tasks, shipments
+from app.utils.middleware import ProfilingMiddleware, RequestSizeLimitMiddleware
+from app.endpoints import invoices, tasks, shipments, profiling
 from app.core.config import Config
 
 logger = logging.getLogger(__name__)
-setup_logging(log_level=Config.LOG_LEVEL, log_file="app.log")
+setup_logging(log_level=Config.LOG_LEVEL, log_file="app.log", slow_query_log_file=Config.SLOW_QUERY_LOG_FILE)
 
 api_key_header = APIKeyHeader(name="Authorization", auto_error=False)
 
@@ -29,6 +31,17 @@ app = FastAPI(
 app.include_router(invoices.router)
 app.include_router(tasks.router)
 app.include_router(shipments.router)
+app.include_router(profiling.router)
+app.add_middleware(GZipMiddleware, minimum_size=Config.GZIP_MIN_SIZE)
+app.add_middleware(RequestSizeLimitMiddleware, max_body_size=Config.MAX_BODY_SIZE)
+if Config.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        profile_dir=Config.PROFILE_DIR,
+        api_key=Config.API_KEY,
+        max_files=Config.PROFILE_MAX_FILES,
+    )
+# CORS добавляется последним, чтобы оставаться внешним слоем и для ответов 413/415
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from app.core.config import Config
+from app.database.models import Counterparty, DocumentType, ProductName
+
+
+class DictionaryCache:
+  """Интернирует строковые значения справочника в их идентификаторы.
+
+  Недостающие записи создаются в отдельной транзакции, чтобы откат сессии
+  вызывающего кода не оставлял в кэше ссылок на несуществующие строки.
+  """
+
+  def __init__(self, model, column, max_size=Config.DICTIONARY_CACHE_SIZE):
+    self.model = model
+    self.column = column
+    self.max_size = max_size
+    self._ids = OrderedDict()
+    self._lock = threading.Lock()
+
+  def resolve(self, session, value):
+    return self.resolve_many(session, [value])[value]
+
+  def resolve_many(self, session, values):
+    resolved = {}
+    missing = set()
+    with self._lock:
+      for value in values:
+        if value in resolved:
+          continue
+        if value in self._ids:
+          self._ids.move_to_end(value)
+          resolved[value] = self._ids[value]
+        else:
+          missing.add(value)
+
+    if missing:
+      fetched = self._fetch_or_create(session, missing)
+      resolved.update(fetched)
+      with self._lock:
+        for value, value_id in fetched.items():
+          self._ids[value] = value_id
+          self._ids.move_to_end(value)
+        while len(self._ids) > self.max_size:
+          self._ids.popitem(last=False)
+
+    return resolved
+
+  def clear(self):
+    with self._lock:
+      self._ids.clear()
+
+  def _fetch_or_create(self, session, values):
+    key = self.column.key
+    with session.get_bind().begin() as connection:
+      # Одинаковый порядок вставки во всех воркерах исключает взаимоблокировки
+      # на уникальном индексе
+      connection.execute(
+        insert(self.model)
+        .values([{key: value} for value in sorted(values)])
+        .on_conflict_do_nothing(index_elements=[key])
+      )
+      rows = connection.execute(
+        select(self.column, self.model.id).where(self.column.in_(values))
+      )
+      return {value: value_id for value, value_id in rows}
+
+
+counterparties = DictionaryCache(Counterparty, Counterparty.bin)
+document_types = DictionaryCache(DocumentType, DocumentType.name)
+product_names = DictionaryCache(ProductName, ProductName.name)
@@ -1,20 +1,58 @@
 from sqlalchemy import Column, ForeignKey, Integer, String, Float, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
 Base = declarative_base()
 
+class Counterparty(Base):
+  __tablename__ = "counterparties"
+
+  id = Column(Integer, primary_key=True, autoincrement=True)
+  bin = Column(String(12), nullable=False, unique=True)
+
+
+class DocumentType(Base):
+  __tablename__ = "document_types"
+
+  id = Column(Integer, primary_key=True, autoincrement=True)
+  name = Column(String(100), nullable=False, unique=True)
+
+
+class ProductName(Base):
+  __tablename__ = "product_names"
+
+  id = Column(Integer, primary_key=True, autoincrement=True)
+  name = Column(String(100), nullable=False, unique=True)
+
+
 class Task(Base):
   __tablename__ = "tasks"
   
   id = Column(Integer, primary_key=True, autoincrement=True)
   user_bin = Column(String(12), nullable=False)
-  document_type = Column(String(100), nullable=False)
-  counterparty_bin = Column(String(12), nullable=False)
-  name = Column(String(100), nullable=False)
+  document_type_id = Column(Integer, ForeignKey("document_types.id", name="fk_tasks_document_type_id"), nullable=False)
+  counterparty_id = Column(Integer, ForeignKey("counterparties.id", name="fk_tasks_counterparty_id"), nullable=False)
+  name_id = Column(Integer, ForeignKey("product_names.id", name="fk_tasks_name_id"), nullable=False)
   quantity = Column(Float, nullable=False)
   price = Column(Float, nullable=False)
   created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+  document_type_ref = relationship(DocumentType, lazy="joined")
+  counterparty_ref = relationship(Counterparty, lazy="joined")
+  name_ref = relationship(ProductName, lazy="joined")
+
+  @property
+  def document_type(self):
+    return self.document_type_ref.name
+
+  @property
+  def counterparty_bin(self):
+    return self.counterparty_ref.bin
+
+  @property
+  def name(self):
+    return self.name_ref.name
   
 class ErrorTask(Base):
   __tablename__ = "error_tasks"
@@ -38,6 +76,12 @@ class ShipmentProduct(Base):
   
   id = Column(Integer, primary_key=True, autoincrement=True)
   shipment_id = Column(Integer, ForeignKey("shipments.id"), nullable=False)
-  tovar_name = Column(String(100), nullable=False)
+  tovar_name_id = Column(Integer, ForeignKey("product_names.id", name="fk_shipment_products_tovar_name_id"), nullable=False)
   tovar_count = Column(Integer, nullable=False)
-  tovar_price = Column(Float, nullable=False)
\ No newline at end of file
+  tovar_price = Column(Float, nullable=False)
+
+  tovar_name_ref = relationship(ProductName, lazy="joined")
+
+  @property
+  def tovar_name(self):
+    return self.tovar_name_ref.name
@@ -1,17 +1,59 @@
-from sqlalchemy import create_engine
+import logging
+import time
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker
 from app.database.models import Base, Task, ErrorTask, Shipment, ShipmentProduct
 from app.core.config import Config
+from app.database.dictionaries import counterparties, document_types, product_names
+from app.utils.logger import truncate_for_log
+
+slow_query_logger = logging.getLogger("slow_query")
 
 engine = create_engine(Config.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def describe_parameters(parameters):
+  if isinstance(parameters, dict):
+    return {key: type(value).__name__ for key, value in parameters.items()}
+  if isinstance(parameters, (list, tuple)):
+    if parameters and isinstance(parameters[0], (dict, list, tuple)):
+      return f"{len(parameters)} x {describe_parameters(parameters[0])}"
+    return [type(value).__name__ for value in parameters]
+  return type(parameters).__name__
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+  context._query_start_time = time.perf_counter()
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def log_slow_query(conn, cursor, statement, parameters, context, executemany):
+  elapsed_ms = (time.perf_counter() - context._query_start_time) * 1000
+  if elapsed_ms < Config.SLOW_QUERY_THRESHOLD_MS:
+    return
+
+  slow_query_logger.warning(
+    f"Медленный запрос {elapsed_ms:.1f} мс (executemany={executemany}): "
+    f"{truncate_for_log(statement, Config.LOG_MAX_LENGTH)} | "
+    f"параметры: {truncate_for_log(describe_parameters(parameters), Config.LOG_MAX_LENGTH)}"
+  )
+
 def init_db():
   Base.metadata.create_all(bind=engine)
 
 
+def resolve_task_references(session, task_data):
+  task_data = dict(task_data)
+  task_data["document_type_id"] = document_types.resolve(session, task_data.pop("document_type"))
+  task_data["counterparty_id"] = counterparties.resolve(session, task_data.pop("counterparty_bin"))
+  task_data["name_id"] = product_names.resolve(session, task_data.pop("name"))
+  return task_data
+
+
 def create_task_in_db(session, task_data):
-  new_task = Task(**task_data)
+  new_task = Task(**resolve_task_references(session, task_data))
   session.add(new_task)
   session.commit()
   session.refresh(new_task)
@@ -40,12 +82,14 @@ def restore_task_from_error(session, task_id, user_bin, document_type, counterpa
   
   restored_task = Task(
     id=error_task.task_id,
-    user_bin=user_bin,
-    document_type=document_type,
-    counterparty_bin=counterparty_bin,
-    name=name,
-    quantity=quantity,
-    price=price,
+    **resolve_task_references(session, {
+      "user_bin": user_bin,
+      "document_type": document_type,
+      "counterparty_bin": counterparty_bin,
+      "name": name,
+      "quantity": quantity,
+      "price": price,
+    }),
   )
   session.add(restored_task)
   session.delete(error_task)
@@ -65,13 +109,28 @@ def create_shipment_in_db(session, shipment_data):
   return new_shipment
 
 
-def add_products_to_shipment(session, shipment_id, products):
+def add_products_to_shipment(session, shipment_id, products, batch_size=Config.SHIPMENT_BATCH_SIZE):
+    # Пакетируется только запись: products приходит уже провалидированным списком,
+    # поэтому пиковую память ограничивает лишь MAX_BODY_SIZE
+    batch = []
     for product in products:
-        new_product = ShipmentProduct(
-            shipment_id=shipment_id,
-            tovar_name=product.tovar_name,
-            tovar_count=product.tovar_count,
-            tovar_price=product.tovar_price,
-        )
-        session.add(new_product)
-    session.commit()
\ No newline at end of file
+        batch.append(product)
+        if len(batch) >= batch_size:
+            insert_shipment_products(session, shipment_id, batch)
+            batch = []
+    if batch:
+        insert_shipment_products(session, shipment_id, batch)
+    session.commit()
+
+
+def insert_shipment_products(session, shipment_id, products):
+    name_ids = product_names.resolve_many(session, [product.tovar_name for product in products])
+    session.execute(insert(ShipmentProduct), [
+        {
+            "shipment_id": shipment_id,
+            "tovar_name_id": name_ids[product.tovar_name],
+            "tovar_count": product.tovar_count,
+            "tovar_price": product.tovar_price,
+        }
+        for product in products
+    ])
\ No newline at end of file
@@ -0,0 +1,67 @@
+import logging
+import re
+from pathlib import Path
+from fastapi import APIRouter, HTTPException, Header
+from fastapi.responses import FileResponse
+from app.core.config import Config
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]{14}-[0-9a-f]{8}$")
+
+
+def check_profiling_access(authorization: str):
+    expected_token = f"Bearer {Config.API_KEY}"
+    if authorization != expected_token:
+        logger.error("Ошибка авторизации")
+        raise HTTPException(status_code=401, detail="Не авторизован")
+
+    if not Config.PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Профилирование отключено")
+
+
+@router.get(
+    "/profiles",
+    tags=["Профилирование"],
+    summary="Список снятых профилей",
+    description="""
+        Этот эндпоинт возвращает список профилей запросов, снятых с заголовком X-Profile: 1
+        """
+    )
+async def list_profiles(authorization: str = Header(None)):
+    check_profiling_access(authorization)
+
+    profile_dir = Path(Config.PROFILE_DIR)
+    if not profile_dir.exists():
+        return {"profiles": []}
+
+    profiles = sorted(profile_dir.glob("*.prof"), reverse=True)
+    return {
+        "profiles": [
+            {"profile_id": path.stem, "size": path.stat().st_size}
+            for path in profiles
+        ]
+    }
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    tags=["Профилирование"],
+    summary="Скачать профиль запроса",
+    description="""
+        Этот эндпоинт отдает файл профиля в формате pstats для анализа (snakeviz, pstats)
+        """
+    )
+async def download_profile(profile_id: str, authorization: str = Header(None)):
+    check_profiling_access(authorization)
+
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        raise HTTPException(status_code=400, detail="Некорректный идентификатор профиля")
+
+    path = Path(Config.PROFILE_DIR) / f"{profile_id}.prof"
+    if not path.exists():
+        logger.error(f"Профиль {profile_id} не найден")
+        raise HTTPException(status_code=404, detail="Профиль не найден")
+
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
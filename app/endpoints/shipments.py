@@ -1,8 +1,9 @@
 import logging
-from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi import APIRouter, HTTPException, Header, Depends, Request
 from sqlalchemy.orm import Session
 from app.core.config import Config
 from app.database.requests import SessionLocal, add_products_to_shipment, create_shipment_in_db
+from app.utils.logger import truncate_for_log
 from pydantic import BaseModel, Field
 from typing import List
 
@@ -52,6 +53,7 @@ class ShipmentsRequest(BaseModel):
           "tovar_price": 5000.0
       }
     ],
+    json_schema_extra={"maxItems": Config.MAX_SHIPMENT_PRODUCTS},
     description="Список товаров, входящих в отгрузку"
   )
 
@@ -63,11 +65,29 @@ def get_db():
   finally:
     db.close()
 
+
+async def check_products_count(request: Request):
+  # Выполняется до валидации ShipmentsRequest, чтобы не проверять каждый товар
+  # слишком большой отгрузки и не возвращать его обратно в ответе 422
+  try:
+    body = await request.json()
+  except ValueError:
+    return
+
+  products = body.get("products") if isinstance(body, dict) else None
+  if isinstance(products, list) and len(products) > Config.MAX_SHIPMENT_PRODUCTS:
+    logger.warning(f"Отклонена отгрузка: товаров {len(products)}, допустимо {Config.MAX_SHIPMENT_PRODUCTS}")
+    raise HTTPException(
+      status_code=413,
+      detail=f"Превышено допустимое количество товаров: {Config.MAX_SHIPMENT_PRODUCTS}"
+    )
+
 @router.post(
   "/shipments",
   tags=["Товары"],
   summary="Создание нового товара",
-  description="Этот эндпоинт создает новый товар"
+  description="Этот эндпоинт создает новый товар",
+  dependencies=[Depends(check_products_count)]
   )
 async def create_shipment(
   shipment: ShipmentsRequest,
@@ -75,7 +95,16 @@ async def create_shipment(
   user_bin: str = Header(None),
   db: Session = Depends(get_db)
 ):
-  logger.info(f"Получен запрос на создание отгрузки {shipment}")
+  logger.info(
+    f"Получен запрос на создание отгрузки: контрагент {truncate_for_log(shipment.contragent_bin, Config.LOG_MAX_LENGTH)}, "
+    f"тип {truncate_for_log(shipment.dct_type, Config.LOG_MAX_LENGTH)}, товаров {len(shipment.products)}"
+  )
+  if logger.isEnabledFor(logging.DEBUG):
+      products_preview = shipment.products[:Config.LOG_MAX_ITEMS]
+      logger.debug(
+        f"Первые товары отгрузки ({len(products_preview)} из {len(shipment.products)}): "
+        f"{truncate_for_log(products_preview, Config.LOG_MAX_LENGTH)}"
+      )
 
   expected_token = f"Bearer {Config.API_KEY}"
   if authorization != expected_token:
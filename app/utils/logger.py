@@ -2,7 +2,7 @@ import logging
 import sys
 from pathlib import Path
 
-def setup_logging(log_level: str = "DEBUG", log_file: str = "app.log"):
+def setup_logging(log_level: str = "DEBUG", log_file: str = "app.log", slow_query_log_file: str = None):
     log_path = Path(log_file).resolve()
 
     log_format = "%(asctime)s - [%(levelname)s] - %(name)s - %(message)s"
@@ -21,4 +21,18 @@ def setup_logging(log_level: str = "DEBUG", log_file: str = "app.log"):
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("fastapi").setLevel(logging.INFO)
 
+    if slow_query_log_file:
+        slow_query_handler = logging.FileHandler(Path(slow_query_log_file).resolve(), encoding="utf-8")
+        slow_query_handler.setFormatter(logging.Formatter(log_format))
+        slow_query_logger = logging.getLogger("slow_query")
+        slow_query_logger.setLevel(logging.WARNING)
+        slow_query_logger.addHandler(slow_query_handler)
+
     logging.info(f"Логирование настроено. Уровень: {log_level}, файл: {log_path}")
+
+
+def truncate_for_log(value, max_length: int = 500) -> str:
+    text = str(value)
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}... (обрезано, всего {len(text)} символов)"
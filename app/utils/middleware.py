@@ -0,0 +1,164 @@
+import cProfile
+import logging
+import uuid
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class RequestSizeLimitMiddleware:
+    """Ограничивает размер тела запроса и распаковывает тела с Content-Encoding: gzip.
+
+    Лимит проверяется до разбора тела: сначала по Content-Length, затем по
+    фактически прочитанным (и распакованным) байтам.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_encoding = headers.get(b"content-encoding", b"").decode("latin-1").strip().lower()
+        content_length = headers.get(b"content-length")
+
+        if content_encoding not in ("", "identity", "gzip"):
+            response = JSONResponse(
+                status_code=415,
+                content={"detail": f"Неподдерживаемая кодировка тела: {content_encoding}"},
+            )
+            await response(scope, receive, send)
+            return
+
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            logger.warning(f"Отклонен запрос {scope['path']}: размер тела {int(content_length)} байт")
+            response = JSONResponse(
+                status_code=413,
+                content={"detail": "Превышен допустимый размер запроса"},
+            )
+            await response(scope, receive, send)
+            return
+
+        if content_encoding == "gzip":
+            scope = dict(scope)
+            scope["headers"] = [
+                (key, value) for key, value in scope["headers"]
+                if key not in (b"content-encoding", b"content-length")
+            ]
+            receive = self._gzip_receive(receive)
+
+        await self.app(scope, self._limited_receive(scope, receive), send)
+
+    def _gzip_receive(self, receive: Receive) -> Receive:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+
+            try:
+                # Ограничиваем выход распаковки, чтобы gzip-бомба не раздула память
+                body = decompressor.decompress(message.get("body", b""), self.max_body_size + 1)
+                if decompressor.unconsumed_tail:
+                    raise HTTPException(status_code=413, detail="Превышен допустимый размер запроса")
+                if not message.get("more_body", False):
+                    body += decompressor.flush()
+            except zlib.error:
+                raise HTTPException(status_code=400, detail="Некорректное gzip-тело запроса")
+
+            return {**message, "body": body}
+
+        return wrapped
+
+    def _limited_receive(self, scope: Scope, receive: Receive) -> Receive:
+        received = 0
+
+        async def wrapped() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    logger.warning(f"Отклонен запрос {scope['path']}: тело превышает {self.max_body_size} байт")
+                    raise HTTPException(status_code=413, detail="Превышен допустимый размер запроса")
+            return message
+
+        return wrapped
+
+
+class ProfilingMiddleware:
+    """Снимает cProfile-профиль отдельного запроса с заголовком X-Profile: 1.
+
+    Профилирование доступно только при включенном PROFILING_ENABLED и валидном
+    токене. Профиль сохраняется в profile_dir, его идентификатор возвращается
+    в заголовке X-Profile-Id и используется для скачивания через /profiles.
+    """
+
+    def __init__(self, app: ASGIApp, profile_dir: str, api_key: str, max_files: int = 50):
+        self.app = app
+        self.profile_dir = Path(profile_dir)
+        self.expected_token = f"Bearer {api_key}".encode("latin-1")
+        self.max_files = max_files
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") != b"1" or headers.get(b"authorization") != self.expected_token:
+            await self.app(scope, receive, send)
+            return
+
+        # Одновременно может работать только один профилировщик
+        if self._active:
+            logger.warning(f"Профилирование {scope['path']} пропущено: уже идет снятие другого профиля")
+            await self.app(scope, receive, send)
+            return
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        profile_id = f"{timestamp}-{uuid.uuid4().hex[:8]}"
+
+        async def send_with_profile_id(message: Message):
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"x-profile-id", profile_id.encode("latin-1"))],
+                }
+            await send(message)
+
+        # Профилировщик захватывает весь поток событийного цикла, поэтому
+        # в профиль могут попасть параллельные запросы
+        self._active = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.disable()
+            self._active = False
+            self._save(profiler, profile_id, scope)
+
+    def _save(self, profiler: cProfile.Profile, profile_id: str, scope: Scope):
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            path = self.profile_dir / f"{profile_id}.prof"
+            profiler.dump_stats(str(path))
+            logger.info(f"Профиль запроса {scope['method']} {scope['path']} сохранен: {path.name}")
+
+            profiles = sorted(self.profile_dir.glob("*.prof"))
+            for old_profile in profiles[:-self.max_files]:
+                old_profile.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Не удалось сохранить профиль {profile_id}: {e}")